@@ -1,17 +1,215 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 from uuid import uuid4
 from copy import deepcopy
+import asyncio
 
 from .models import (
     GraphCreateRequest,
     ExecutionStep,
     GraphStateResponse,
 )
-from .tools import ToolRegistry
+from .tools import Tool, ToolRegistry
+
+
+# Combines the output states of one concurrently executed layer into the next state
+Reducer = Callable[[Dict[str, Any], List[Dict[str, Any]]], Dict[str, Any]]
+
+# A stream listener: the event loop it lives on and the queue that receives new steps
+Subscriber = Tuple[asyncio.AbstractEventLoop, "asyncio.Queue[Optional[ExecutionStep]]"]
+
+# Per-run memo for pure tools: tool name -> (last input state, its output state)
+ToolMemo = Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]]
+
+_ATOMIC_TYPES = frozenset((str, int, float, bool, type(None)))
+_MISSING = object()
+
+# Sentinels stored in Graph.next_index
+_TERMINAL = -1
+_FAN_OUT = -2
+
+
+def _copy_tree(value: Any) -> Any:
+    """
+    Copy a JSON-like tree of dicts / lists / tuples.
+
+    State dicts never contain cycles, so this skips the memo bookkeeping of
+    ``copy.deepcopy``. Atomic values are returned by reference; they are checked
+    inline so the common leaves (strings, numbers) cost no extra call.
+    """
+    cls = type(value)
+    if cls is dict:
+        return {k: v if type(v) in _ATOMIC_TYPES else _copy_tree(v) for k, v in value.items()}
+    if cls is list:
+        return [v if type(v) in _ATOMIC_TYPES else _copy_tree(v) for v in value]
+    if cls is tuple:
+        return tuple([v if type(v) in _ATOMIC_TYPES else _copy_tree(v) for v in value])
+    if cls in _ATOMIC_TYPES:
+        return value
+    # Anything exotic (sets, custom objects, ...) goes through the slow path
+    return deepcopy(value)
+
+
+def _same_value(a: Any, b: Any) -> bool:
+    return a is b or (type(a) is type(b) and a == b)
+
+
+def _same_inputs(tool: Tool, state: Dict[str, Any], previous: Dict[str, Any]) -> bool:
+    """
+    True if `state` matches `previous` on every key the tool declares as input.
+    """
+    if tool.inputs is None:
+        return state is previous or (
+            state.keys() == previous.keys()
+            and all(_same_value(v, previous[k]) for k, v in state.items())
+        )
+    return all(
+        _same_value(state.get(key, _MISSING), previous.get(key, _MISSING))
+        for key in tool.inputs
+    )
+
+
+def _shallow_freeze(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a state dict plus its top-level lists / dicts / sets, sharing everything deeper.
+
+    Tools only replace top-level keys or append to / update top-level containers
+    (e.g. "suggestions", "metadata"), so this is enough to keep logged states intact
+    at O(top-level size) instead of O(whole tree). The pure-tool memo relies on the
+    same contract: a tool that mutates a nested container in place also changes the
+    inputs the memo compares against, and may be replayed with stale output.
+    """
+    return {
+        k: (v.copy() if isinstance(v, (list, dict, set)) else v) for k, v in state.items()
+    }
+
+
+def _topo_layers(
+    start_node_id: str,
+    successors: Dict[str, List[str]],
+) -> Optional[List[List[str]]]:
+    """
+    Group the nodes reachable from the start node into layers (Kahn's algorithm).
+
+    Every node only depends on nodes in earlier layers, so the nodes of one
+    layer can run concurrently. Returns None if the static edges contain a cycle.
+    """
+    reachable: List[str] = [start_node_id]
+    seen = {start_node_id}
+    for node_id in reachable:
+        for dst in successors.get(node_id, []):
+            if dst not in seen:
+                seen.add(dst)
+                reachable.append(dst)
+
+    indegree = {node_id: 0 for node_id in reachable}
+    for node_id in reachable:
+        for dst in successors.get(node_id, []):
+            indegree[dst] += 1
+
+    layers: List[List[str]] = []
+    ready = [node_id for node_id in reachable if indegree[node_id] == 0]
+    placed = 0
+    while ready:
+        layers.append(ready)
+        placed += len(ready)
+        next_ready: List[str] = []
+        for node_id in ready:
+            for dst in successors.get(node_id, []):
+                indegree[dst] -= 1
+                if indegree[dst] == 0:
+                    next_ready.append(dst)
+        ready = next_ready
+
+    if placed != len(reachable):
+        return None
+    return layers
+
+
+def _critical_path_lengths(
+    layers: List[List[str]],
+    successors: Dict[str, List[str]],
+) -> Dict[str, int]:
+    """
+    Number of nodes on the longest path from each node to a terminal node.
+    """
+    lengths: Dict[str, int] = {}
+    for layer in reversed(layers):
+        for node_id in layer:
+            lengths[node_id] = 1 + max(
+                (lengths[dst] for dst in successors.get(node_id, [])), default=0
+            )
+    return lengths
+
+
+def _merge_conflicting_update(key: str, base: Any, merged: Any, value: Any) -> Any:
+    """
+    Combine two updates of the same top-level key made by nodes of one layer.
+
+    Dicts are merged by sub-key and lists that both extend the base list are
+    concatenated; any other disagreement raises ValueError.
+    """
+    if merged == value:
+        return merged
+    if (
+        isinstance(merged, dict)
+        and isinstance(value, dict)
+        and (base is None or isinstance(base, dict))
+    ):
+        base = base or {}
+        combined = dict(merged)
+        for sub_key, sub_value in value.items():
+            before = base.get(sub_key, _MISSING)
+            if before == sub_value:
+                continue
+            current = merged.get(sub_key, _MISSING)
+            if current is not _MISSING and current != before and current != sub_value:
+                raise ValueError(
+                    f"Nodes in the same layer made conflicting updates to '{key}.{sub_key}'."
+                )
+            combined[sub_key] = sub_value
+        return combined
+    if (
+        isinstance(merged, list)
+        and isinstance(value, list)
+        and (base is None or isinstance(base, list))
+    ):
+        base = base or []
+        if merged[: len(base)] == base and value[: len(base)] == base:
+            return merged + value[len(base):]
+    raise ValueError(f"Nodes in the same layer made conflicting updates to '{key}'.")
+
+
+def merge_layer_outputs(
+    state: Dict[str, Any],
+    outputs: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Default reducer for concurrently executed nodes.
+
+    Each node received its own copy of `state`, so only the keys a node actually
+    added or changed are applied (in topological order); unchanged keys are
+    ignored so one node cannot clobber another node's result with a stale value.
+    If several nodes change the same key, see _merge_conflicting_update.
+    """
+    merged = dict(state)
+    changed = set()
+    for output in outputs:
+        for key, value in output.items():
+            base = state.get(key, _MISSING)
+            if base is not _MISSING and base == value:
+                continue
+            if key in changed:
+                base = None if base is _MISSING else base
+                merged[key] = _merge_conflicting_update(key, base, merged[key], value)
+            else:
+                merged[key] = value
+                changed.add(key)
+    return merged
 
 
 @dataclass
@@ -23,7 +221,25 @@ class Graph:
     name: str
     start_node_id: str
     nodes: Dict[str, str]  # node_id -> tool_name
-    edges: Dict[str, Optional[str]]  # node_id -> next_node_id (or None)
+    edges: Dict[str, Union[None, str, List[str]]]  # node_id -> next node id(s) (or None)
+    successors: Dict[str, List[str]]  # normalised edges: node_id -> next node ids
+    resolved_nodes: Dict[str, Tool]  # node_id -> registered tool, resolved once at creation
+    # Integer-indexed view used by the sequential run loop. Nodes are in topological
+    # order, followed (in declaration order) by any node that is unreachable or on a cycle.
+    topo_order: List[str]
+    node_index: Dict[str, int]  # node_id -> position in topo_order
+    next_index: List[int]  # position of the static next node, _TERMINAL or _FAN_OUT
+    indexed_tools: List[Tool]  # resolved tool per position in topo_order
+    # Nodes grouped by dependency depth; None if the static edges contain a cycle
+    layers: Optional[List[List[str]]] = None
+
+    @property
+    def is_fork_join(self) -> bool:
+        """
+        True if some node fans out to several nodes; create_graph ensures such graphs
+        are acyclic, so they can run layer by layer.
+        """
+        return _FAN_OUT in self.next_index
 
 
 @dataclass
@@ -38,20 +254,42 @@ class RunRecord:
     log: List[ExecutionStep]
     status: str
     error: Optional[str] = None
+    # Fed with every new step, then None once the run has finished
+    subscribers: List[Subscriber] = field(default_factory=list)
+
+    def publish(self, item: Optional[ExecutionStep]) -> None:
+        """
+        Push a step (or None once the run has finished) to every subscriber.
+        Safe to call from executor threads. Subscribers whose event loop has been
+        closed are dropped instead of failing the run.
+        """
+        for subscriber in list(self.subscribers):
+            loop, queue = subscriber
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:  # Event loop is closed
+                self.subscribers = [s for s in self.subscribers if s is not subscriber]
 
 
 class GraphEngine:
     """
     Minimal graph engine that:
       * keeps graphs and run records in memory
-      * executes nodes sequentially
+      * executes nodes sequentially, or layer by layer for fork/join graphs
       * supports simple loops and branching via the state["_next_node"] convention
     """
 
+    # Sequential runs publish state / current node to their RunRecord every N steps
+    # (and always when the run ends) rather than after every single step, unless the
+    # run was started in the background and can be polled while it runs.
+    RUN_RECORD_FLUSH_INTERVAL = 16
+
     def __init__(self, tool_registry: ToolRegistry) -> None:
         self.tool_registry = tool_registry
         self.graphs: Dict[str, Graph] = {}
         self.runs: Dict[str, RunRecord] = {}
+        # Strong references to runs started with start_run, so they are not GC'd mid-run
+        self._background_runs: Set["asyncio.Task[Any]"] = set()
 
     # ---------- Graph Management ----------
 
@@ -59,105 +297,249 @@ class GraphEngine:
         """
         Register a new graph in memory.
         """
-        # Basic validation
-        node_ids = {n.id for n in req.nodes}
+        # Basic validation (the keys view of `nodes` doubles as the node id set)
+        nodes = {n.id: n.tool_name for n in req.nodes}
+        node_ids = nodes.keys()
         if req.start_node_id not in node_ids:
             raise ValueError("start_node_id must be one of the node IDs")
 
-        for src, dst in req.edges.items():
-            if src not in node_ids:
-                raise ValueError(f"Edge source '{src}' is not a valid node id")
-            if dst is not None and dst not in node_ids:
-                raise ValueError(f"Edge target '{dst}' is not a valid node id")
+        bad_src = req.edges.keys() - node_ids
+        if bad_src:
+            raise ValueError(f"Edge source '{min(bad_src)}' is not a valid node id")
+
+        successors: Dict[str, List[str]] = {
+            src: [] if dst is None else [dst] if isinstance(dst, str) else list(dst)
+            for src, dst in req.edges.items()
+        }
+        bad_dst = {dst for targets in successors.values() for dst in targets} - node_ids
+        if bad_dst:
+            raise ValueError(f"Edge target '{min(bad_dst)}' is not a valid node id")
+
+        # Resolve tools up front so execution never has to go through the registry
+        resolved_nodes: Dict[str, Tool] = {}
+        for n in req.nodes:
+            try:
+                resolved_nodes[n.id] = self.tool_registry.get_tool(n.tool_name)
+            except KeyError:
+                raise ValueError(
+                    f"Node '{n.id}' uses unknown tool '{n.tool_name}'"
+                ) from None
 
         graph_id = str(uuid4())
-        nodes = {n.id: n.tool_name for n in req.nodes}
         edges = req.edges
 
+        layers = _topo_layers(req.start_node_id, successors)
+        if layers is not None:
+            # Within a layer, nodes on the longest remaining path go first
+            priority = _critical_path_lengths(layers, successors)
+            layers = [sorted(layer, key=lambda n: -priority[n]) for layer in layers]
+
+        topo_order = [node_id for layer in layers or [] for node_id in layer]
+        placed = set(topo_order)
+
+        # Fan-outs only run layer by layer, which needs every one of them to be placed
+        fan_outs = [node_id for node_id, targets in successors.items() if len(targets) > 1]
+        if fan_outs and layers is None:
+            raise ValueError(
+                f"Node '{fan_outs[0]}' fans out to several nodes, so the graph must not "
+                "contain a cycle"
+            )
+        unreachable = [node_id for node_id in fan_outs if node_id not in placed]
+        if unreachable:
+            raise ValueError(
+                f"Node '{unreachable[0]}' fans out to several nodes but is not reachable "
+                "from the start node"
+            )
+        topo_order += [node_id for node_id in nodes if node_id not in placed]
+        node_index = {node_id: i for i, node_id in enumerate(topo_order)}
+
+        next_index: List[int] = []
+        for node_id in topo_order:
+            targets = successors.get(node_id, [])
+            if not targets:
+                next_index.append(_TERMINAL)
+            elif len(targets) == 1:
+                next_index.append(node_index[targets[0]])
+            else:
+                next_index.append(_FAN_OUT)
+
         graph = Graph(
             id=graph_id,
             name=req.name,
             start_node_id=req.start_node_id,
             nodes=nodes,
             edges=edges,
+            successors=successors,
+            resolved_nodes=resolved_nodes,
+            topo_order=topo_order,
+            node_index=node_index,
+            next_index=next_index,
+            indexed_tools=[resolved_nodes[node_id] for node_id in topo_order],
+            layers=layers,
         )
         self.graphs[graph_id] = graph
         return graph_id
 
     # ---------- Execution ----------
 
+    def _start_run(
+        self,
+        graph: Graph,
+        state: Dict[str, Any],
+        log: List[ExecutionStep],
+        run_id: Optional[str] = None,
+    ) -> RunRecord:
+        # The record shares `log` with the run loop, so appended steps are visible as-is.
+        # `state` is only ever replaced by the run (tools work on copies), so it is
+        # shared too rather than copied.
+        if run_id is not None and run_id in self.runs:
+            # Record reserved by start_run; keep it (and its subscribers) and take it over
+            run_record = self.runs[run_id]
+            run_record.state = state
+            run_record.log = log
+            return run_record
+
+        run_record = RunRecord(
+            id=run_id or str(uuid4()),
+            graph_id=graph.id,
+            state=state,
+            current_node_id=graph.start_node_id,
+            log=log,
+            status="running",
+        )
+        self.runs[run_record.id] = run_record
+        return run_record
+
+    def _invoke_tool(
+        self,
+        tool: Tool,
+        state: Dict[str, Any],
+        cache: ToolMemo,
+    ) -> Dict[str, Any]:
+        """
+        Run a tool on a private copy of `state`, reusing memoized output for pure tools.
+
+        A pure tool whose inputs equal those of its previous call in this run is not
+        called again. With declared inputs, the declared output keys of the previous
+        call are copied onto the current state (or removed if the tool left them out);
+        without, the whole state matched, so the previous output is reused as is.
+        Comparing against the last call only keeps the common case (each node runs
+        once) down to storing two references.
+
+        Neither `state` nor anything nested in the returned state is mutated later:
+        the next tool again works on its own (shallow-frozen) copy. The returned dict
+        itself may still lose its "_next_node" key, so memoized outputs are stored as
+        a top-level copy.
+        """
+        if tool.pure and tool.name in cache:
+            previous_input, previous_output = cache[tool.name]
+            if _same_inputs(tool, state, previous_input):
+                if tool.outputs is None:
+                    return dict(previous_output)
+                output_state = dict(state)
+                for key in tool.outputs:
+                    value = previous_output.get(key, _MISSING)
+                    if value is _MISSING:
+                        output_state.pop(key, None)
+                    else:
+                        output_state[key] = value
+                return output_state
+
+        output_state = tool.fn(_shallow_freeze(state))
+
+        # Either return a new state dict or mutate in place and return None
+        if output_state is None:
+            output_state = state
+        if tool.pure:
+            cache[tool.name] = (state, dict(output_state))
+        return output_state
+
     def run_graph(
         self,
         graph_id: str,
         initial_state: Dict[str, Any],
         max_steps: int = 50,
+        copy_initial_state: bool = True,
+        run_id: Optional[str] = None,
     ) -> Tuple[str, Dict[str, Any], List[ExecutionStep]]:
         """
         Execute a graph from start to finish synchronously.
         Returns (run_id, final_state, execution_log).
+
+        Pass copy_initial_state=False only if the caller owns `initial_state` and
+        nobody else holds on to it (e.g. a freshly decoded request body); the run
+        then uses it directly instead of copying it first.
+        `run_id` is only set by start_run, which reserves the record up front.
         """
         if graph_id not in self.graphs:
             raise KeyError(graph_id)
 
         graph = self.graphs[graph_id]
-        run_id = str(uuid4())
-        state: Dict[str, Any] = deepcopy(initial_state)
+        if graph.is_fork_join:
+            raise ValueError(
+                f"Graph '{graph_id}' fans out to several nodes; "
+                "fork/join graphs must be run with run_graph_async."
+            )
+        state: Dict[str, Any] = (
+            _copy_tree(initial_state) if copy_initial_state else initial_state
+        )
         log: List[ExecutionStep] = []
 
-        run_record = RunRecord(
-            id=run_id,
-            graph_id=graph_id,
-            state=deepcopy(state),
-            current_node_id=graph.start_node_id,
-            log=[],
-            status="running",
-        )
-        self.runs[run_id] = run_record
+        # A reserved run_id was already handed out (see start_run), so the record can
+        # be polled while the run is in progress and must be current after every step
+        flush_interval = 1 if run_id in self.runs else self.RUN_RECORD_FLUSH_INTERVAL
+        run_record = self._start_run(graph, state, log, run_id)
+        run_id = run_record.id
 
-        current_node_id: Optional[str] = graph.start_node_id
+        node_ids = graph.topo_order
+        tools = graph.indexed_tools
+        next_index = graph.next_index
+        current_idx = graph.node_index[graph.start_node_id]
         step_index = 0
 
+        cache: ToolMemo = {}
+
         try:
             for step_index in range(max_steps):
-                if current_node_id is None:
+                if current_idx == _TERMINAL:
                     break
 
-                tool_name = graph.nodes[current_node_id]
-                tool_fn = self.tool_registry.get(tool_name)
+                current_node_id = node_ids[current_idx]
+                tool = tools[current_idx]
 
-                # Make defensive copies so the log is easier to inspect
-                input_state = deepcopy(state)
-                output_state = tool_fn(deepcopy(state))
-
-                # Either return a new state dict or mutate in place and return None
-                if output_state is None:
-                    output_state = state
-                state = output_state
+                # Tools work on a private copy, so the log can reference states directly
+                input_state = state
+                state = self._invoke_tool(tool, state, cache)
 
                 step = ExecutionStep(
                     step_index=step_index,
                     node_id=current_node_id,
-                    tool_name=tool_name,
+                    tool_name=tool.name,
                     input_state=input_state,
-                    output_state=deepcopy(state),
+                    output_state=state,
                 )
                 log.append(step)
+                if run_record.subscribers:
+                    run_record.publish(step)
 
                 # Branching / looping convention:
                 # If the tool sets state["_next_node"], use that and then delete the key.
-                # Otherwise fall back to the static edges mapping.
-                next_node_id: Optional[str]
+                # Otherwise fall back to the precomputed static successor.
                 if "_next_node" in state:
                     next_node_id = state.pop("_next_node")
+                    current_idx = (
+                        _TERMINAL if next_node_id is None else graph.node_index[next_node_id]
+                    )
                 else:
-                    next_node_id = graph.edges.get(current_node_id)
-
-                current_node_id = next_node_id
+                    current_idx = next_index[current_idx]
 
-                # Update run record after each step (for potential future async / streaming)
-                run_record.state = deepcopy(state)
-                run_record.current_node_id = current_node_id
-                run_record.log = log.copy()
+                # Periodically update the run record (the log is shared and always current).
+                # `state` is replaced rather than mutated by the next step, so no copy needed.
+                if step_index % flush_interval == 0:
+                    run_record.state = state
+                    run_record.current_node_id = (
+                        node_ids[current_idx] if current_idx >= 0 else None
+                    )
 
             else:
                 # Loop exhausted without hitting a terminal node
@@ -166,14 +548,168 @@ class GraphEngine:
                     "Your graph likely has an infinite loop."
                 )
 
+            run_record.state = state
+            run_record.current_node_id = None
             run_record.status = "completed"
         except Exception as exc:  # Catch-all to mark the run as failed
+            run_record.state = state
+            run_record.current_node_id = node_ids[current_idx] if current_idx >= 0 else None
             run_record.status = "failed"
             run_record.error = str(exc)
             raise
+        finally:
+            run_record.publish(None)
 
         return run_id, state, log
 
+    async def run_graph_async(
+        self,
+        graph_id: str,
+        initial_state: Dict[str, Any],
+        max_steps: int = 50,
+        reducer: Optional[Reducer] = None,
+        copy_initial_state: bool = True,
+        run_id: Optional[str] = None,
+    ) -> Tuple[str, Dict[str, Any], List[ExecutionStep]]:
+        """
+        Execute a graph without blocking the event loop.
+
+        Fork/join graphs run layer by layer: all nodes of a layer get a copy of the
+        same state and execute concurrently in the default executor, then their
+        outputs are combined by `reducer` (default: merge_layer_outputs).
+        Every other graph, including those that loop via "_next_node", runs through
+        the sequential run_graph in the executor.
+        See run_graph for `copy_initial_state` and `run_id`.
+        Returns (run_id, final_state, execution_log).
+        """
+        if graph_id not in self.graphs:
+            raise KeyError(graph_id)
+
+        graph = self.graphs[graph_id]
+        loop = asyncio.get_running_loop()
+        if not graph.is_fork_join:
+            return await loop.run_in_executor(
+                None,
+                partial(
+                    self.run_graph,
+                    graph_id,
+                    initial_state,
+                    max_steps,
+                    copy_initial_state=copy_initial_state,
+                    run_id=run_id,
+                ),
+            )
+
+        reducer = reducer or merge_layer_outputs
+        state: Dict[str, Any] = (
+            _copy_tree(initial_state) if copy_initial_state else initial_state
+        )
+        log: List[ExecutionStep] = []
+        run_record = self._start_run(graph, state, log, run_id)
+        cache: ToolMemo = {}
+
+        try:
+            for layer in graph.layers or []:
+                # Same limit as run_graph: a run must finish in fewer than max_steps steps
+                if len(log) + len(layer) >= max_steps:
+                    raise ValueError(
+                        f"Max steps ({max_steps}) reached before the graph finished."
+                    )
+
+                run_record.current_node_id = layer[0]
+                tools = [graph.resolved_nodes[node_id] for node_id in layer]
+                outputs = await asyncio.gather(
+                    *[
+                        loop.run_in_executor(None, self._invoke_tool, tool, state, cache)
+                        for tool in tools
+                    ]
+                )
+
+                for node_id, tool, output_state in zip(layer, tools, outputs):
+                    step = ExecutionStep(
+                        step_index=len(log),
+                        node_id=node_id,
+                        tool_name=tool.name,
+                        input_state=state,
+                        output_state=output_state,
+                    )
+                    log.append(step)
+                    if run_record.subscribers:
+                        run_record.publish(step)
+                    # Branching needs a single active node, so only "stop" is meaningful here
+                    if output_state.pop("_next_node", None) is not None:
+                        raise ValueError(
+                            f"Node '{node_id}' set _next_node, which is not supported "
+                            "in fork/join graphs."
+                        )
+
+                state = reducer(state, list(outputs))
+                run_record.state = state
+
+            run_record.current_node_id = None
+            run_record.status = "completed"
+        except Exception as exc:  # Catch-all to mark the run as failed
+            run_record.status = "failed"
+            run_record.error = str(exc)
+            raise
+        finally:
+            run_record.publish(None)
+
+        return run_record.id, state, log
+
+    def start_run(
+        self,
+        graph_id: str,
+        initial_state: Dict[str, Any],
+        max_steps: int = 50,
+        copy_initial_state: bool = True,
+    ) -> str:
+        """
+        Start run_graph_async as a background task and return its run_id right away.
+        Must be called from a running event loop.
+
+        The run record exists (status "running") before this returns, so the run can
+        be polled via get_run_state or streamed via subscribe immediately.
+        """
+        if graph_id not in self.graphs:
+            raise KeyError(graph_id)
+
+        graph = self.graphs[graph_id]
+        run_id = self._start_run(graph, initial_state, []).id
+        task = asyncio.create_task(
+            self.run_graph_async(
+                graph_id,
+                initial_state,
+                max_steps,
+                copy_initial_state=copy_initial_state,
+                run_id=run_id,
+            )
+        )
+        self._background_runs.add(task)
+        task.add_done_callback(partial(self._finish_background_run, run_id))
+        return run_id
+
+    def _finish_background_run(self, run_id: str, task: "asyncio.Task[Any]") -> None:
+        """
+        Make sure a background run ends up completed or failed.
+
+        Failures inside the run are already recorded on its RunRecord. A task that
+        was cancelled, or failed before taking over the reserved record, still leaves
+        it "running"; mark it failed and end its streams.
+        """
+        self._background_runs.discard(task)
+        if task.cancelled():
+            error = "Run was cancelled"
+        else:
+            exc = task.exception()
+            error = None if exc is None else str(exc) or type(exc).__name__
+
+        run_record = self.runs[run_id]
+        if run_record.status == "running":
+            run_record.status = "failed"
+            run_record.error = error or "Run ended without a result"
+            run_record.publish(None)
+
     # ---------- Introspection ----------
 
     def get_run_state(self, run_id: str) -> GraphStateResponse:
@@ -187,6 +723,32 @@ class GraphEngine:
             status=r.status,  # type: ignore[arg-type]
             current_node_id=r.current_node_id,
             state=r.state,
-            log=r.log,
+            log=list(r.log),
             error=r.error,
         )
+
+    def subscribe(
+        self,
+        run_id: str,
+    ) -> Tuple[RunRecord, "asyncio.Queue[Optional[ExecutionStep]]"]:
+        """
+        Register a stream listener for a run. Must be called from a running event loop.
+
+        The queue only receives steps logged after subscribing (and None once the
+        run has finished); earlier steps are read from the returned record's log.
+        """
+        if run_id not in self.runs:
+            raise KeyError(run_id)
+
+        r = self.runs[run_id]
+        queue: "asyncio.Queue[Optional[ExecutionStep]]" = asyncio.Queue()
+        r.subscribers.append((asyncio.get_running_loop(), queue))
+        return r, queue
+
+    def unsubscribe(
+        self,
+        run_id: str,
+        queue: "asyncio.Queue[Optional[ExecutionStep]]",
+    ) -> None:
+        r = self.runs[run_id]
+        r.subscribers = [sub for sub in r.subscribers if sub[1] is not queue]
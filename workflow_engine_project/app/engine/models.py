@@ -1,5 +1,5 @@
 
-from typing import Any, Dict, List, Optional, Literal
+from typing import Any, Dict, List, Optional, Literal, Union
 from pydantic import BaseModel, Field
 
 
@@ -23,9 +23,12 @@ class GraphCreateRequest(BaseModel):
     name: str = Field(..., description="Human friendly name of the graph")
     start_node_id: str = Field(..., description="ID of the first node to run")
     nodes: List[NodeDefinition]
-    edges: Dict[str, Optional[str]] = Field(
+    edges: Dict[str, Union[None, str, List[str]]] = Field(
         ...,
-        description="Mapping from node_id -> next_node_id (use null for terminal nodes)",
+        description=(
+            "Mapping from node_id -> next_node_id (use null for terminal nodes). "
+            "A list of node ids fans out to several nodes that run concurrently."
+        ),
     )
 
 
@@ -70,6 +73,13 @@ class GraphRunResponse(BaseModel):
     log: List[ExecutionStep]
 
 
+class GraphRunStartResponse(BaseModel):
+    """
+    Response from POST /graph/run/background.
+    """
+    run_id: str
+
+
 # ---------- Run State Query Model ----------
 
 
@@ -1,7 +1,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 import statistics
 
@@ -14,6 +14,11 @@ class Tool:
     name: str
     fn: ToolFn
     description: str = ""
+    # Pure tools depend only on their input state, so the engine may reuse their output
+    pure: bool = False
+    # State keys a pure tool reads and writes; None means "the whole state"
+    inputs: Optional[Tuple[str, ...]] = None
+    outputs: Optional[Tuple[str, ...]] = None
 
 
 class ToolRegistry:
@@ -24,13 +29,34 @@ class ToolRegistry:
     def __init__(self) -> None:
         self._tools: Dict[str, Tool] = {}
 
-    def register(self, name: str, fn: ToolFn, description: str = "") -> None:
-        self._tools[name] = Tool(name=name, fn=fn, description=description)
+    def register(
+        self,
+        name: str,
+        fn: ToolFn,
+        description: str = "",
+        pure: bool = False,
+        inputs: Optional[Sequence[str]] = None,
+        outputs: Optional[Sequence[str]] = None,
+    ) -> None:
+        # Replaying a call on a partially matching state needs to know what it wrote
+        if pure and inputs is not None and outputs is None:
+            raise ValueError(f"Pure tool '{name}' declares inputs but no outputs")
+        self._tools[name] = Tool(
+            name=name,
+            fn=fn,
+            description=description,
+            pure=pure,
+            inputs=None if inputs is None else tuple(inputs),
+            outputs=None if outputs is None else tuple(outputs),
+        )
 
-    def get(self, name: str) -> ToolFn:
+    def get_tool(self, name: str) -> Tool:
         if name not in self._tools:
             raise KeyError(f"Tool '{name}' is not registered")
-        return self._tools[name].fn
+        return self._tools[name]
+
+    def get(self, name: str) -> ToolFn:
+        return self.get_tool(name).fn
 
     def list_tools(self) -> List[str]:
         return sorted(self._tools.keys())
@@ -55,8 +81,10 @@ def extract_functions_tool(state: Dict[str, Any]) -> Dict[str, Any]:
             if name:
                 functions.append(name)
 
-    state["functions"] = functions
-    state.setdefault("metadata", {})["num_functions"] = len(functions)
+    metadata: Dict[str, Any] = state.get("metadata") or {}
+    metadata["num_functions"] = len(functions)
+
+    state.update({"functions": functions, "metadata": metadata})
     return state
 
 
@@ -102,6 +130,7 @@ def suggest_improvements_tool(state: Dict[str, Any]) -> Dict[str, Any]:
     """
     complexities: Dict[str, int] = state.get("complexity", {})
     issues: List[str] = state.get("issues", [])
+    functions: List[str] = state.get("functions", [])
     suggestions: List[str] = state.get("suggestions", [])
 
     # Complexity based suggestions
@@ -117,7 +146,6 @@ def suggest_improvements_tool(state: Dict[str, Any]) -> Dict[str, Any]:
         suggestions.append(f"Address issue: {issue}")
 
     # Generic suggestion to add docstrings
-    functions: List[str] = state.get("functions", [])
     for fn_name in functions:
         suggestions.append(
             f"Ensure '{fn_name}' has a clear docstring explaining inputs and outputs."
@@ -153,16 +181,19 @@ def quality_gate_tool(state: Dict[str, Any]) -> Dict[str, Any]:
     quality_score = base_score - penalty_complex - penalty_issues
     quality_score = max(0.0, min(1.0, quality_score))
 
-    state["quality_score"] = round(quality_score, 3)
-    state["metadata"] = state.get("metadata", {})
-    state["metadata"]["complex_functions"] = complex_functions
+    metadata: Dict[str, Any] = state.get("metadata") or {}
+    metadata["complex_functions"] = complex_functions
 
-    if quality_score < threshold:
-        # Ask graph engine to loop back to suggestions node
-        state["_next_node"] = "suggest_improvements"
-    else:
-        state["_next_node"] = None
+    # Ask graph engine to loop back to suggestions node, or stop
+    next_node = "suggest_improvements" if quality_score < threshold else None
 
+    state.update(
+        {
+            "quality_score": round(quality_score, 3),
+            "metadata": metadata,
+            "_next_node": next_node,
+        }
+    )
     return state
 
 
@@ -179,16 +210,25 @@ def register_code_review_tools_and_graph(engine, registry: ToolRegistry) -> str:
         "extract_functions",
         extract_functions_tool,
         description="Extract function names from Python source code.",
+        pure=True,
+        inputs=("code", "metadata"),
+        outputs=("functions", "metadata"),
     )
     registry.register(
         "check_complexity",
         check_complexity_tool,
         description="Compute a toy complexity metric for each function.",
+        pure=True,
+        inputs=("functions",),
+        outputs=("complexity",),
     )
     registry.register(
         "detect_basic_issues",
         detect_basic_issues_tool,
         description="Detect simple style issues in the source code.",
+        pure=True,
+        inputs=("code",),
+        outputs=("issues",),
     )
     registry.register(
         "suggest_improvements",
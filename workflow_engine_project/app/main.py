@@ -1,5 +1,5 @@
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Any, Dict, List
 from uuid import uuid4
@@ -10,6 +10,7 @@ from .engine.models import (
     GraphStateResponse,
     GraphCreateResponse,
     GraphRunResponse,
+    GraphRunStartResponse,
 )
 from .engine.graph_engine import GraphEngine
 from .engine.tools import ToolRegistry, register_code_review_tools_and_graph
@@ -42,9 +43,9 @@ def startup_event() -> None:
 
 @app.post("/graph/create", response_model=GraphCreateResponse)
 def create_graph(payload: GraphCreateRequest) -> GraphCreateResponse:
-    \"""
+    """
     Create a new workflow graph from a simple JSON description.
-    \"""
+    """
     try:
         graph_id = graph_engine.create_graph(payload)
         return GraphCreateResponse(graph_id=graph_id)
@@ -53,16 +54,19 @@ def create_graph(payload: GraphCreateRequest) -> GraphCreateResponse:
 
 
 @app.post("/graph/run", response_model=GraphRunResponse)
-def run_graph(payload: GraphRunRequest) -> GraphRunResponse:
-    \"""
+async def run_graph(payload: GraphRunRequest) -> GraphRunResponse:
+    """
     Run a previously created graph from a given initial state.
-    This executes synchronously until completion (or until max_steps is hit).
-    \"""
+    The request completes once the run finishes (or max_steps is hit); independent
+    nodes of fork/join graphs execute concurrently.
+    """
     try:
-        run_id, final_state, log = graph_engine.run_graph(
+        run_id, final_state, log = await graph_engine.run_graph_async(
             graph_id=payload.graph_id,
             initial_state=payload.initial_state,
             max_steps=payload.max_steps,
+            # The request body was just decoded by pydantic, so nobody else holds it
+            copy_initial_state=False,
         )
         return GraphRunResponse(run_id=run_id, final_state=final_state, log=log)
     except KeyError:
@@ -74,11 +78,33 @@ def run_graph(payload: GraphRunRequest) -> GraphRunResponse:
         raise HTTPException(status_code=400, detail=str(exc))
 
 
+@app.post("/graph/run/background", response_model=GraphRunStartResponse, status_code=202)
+async def start_graph_run(payload: GraphRunRequest) -> GraphRunStartResponse:
+    """
+    Start a run in the background and return its run_id immediately.
+    Follow it via GET /graph/state/{run_id} or the /graph/stream/{run_id} WebSocket.
+    """
+    try:
+        run_id = graph_engine.start_run(
+            graph_id=payload.graph_id,
+            initial_state=payload.initial_state,
+            max_steps=payload.max_steps,
+            # The request body was just decoded by pydantic, so nobody else holds it
+            copy_initial_state=False,
+        )
+        return GraphRunStartResponse(run_id=run_id)
+    except KeyError:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Graph with id '{payload.graph_id}' not found",
+        )
+
+
 @app.get("/graph/state/{run_id}", response_model=GraphStateResponse)
 def get_graph_state(run_id: str) -> GraphStateResponse:
-    \"""
+    """
     Return the current state and execution log for a (possibly completed) run.
-    \"""
+    """
     try:
         run_state = graph_engine.get_run_state(run_id)
         return run_state
@@ -89,11 +115,56 @@ def get_graph_state(run_id: str) -> GraphStateResponse:
         )
 
 
+@app.websocket("/graph/stream/{run_id}")
+async def stream_graph_run(websocket: WebSocket, run_id: str) -> None:
+    """
+    Stream the execution log of a run, one ExecutionStep per message.
+
+    Steps already logged are sent first, then new steps as the engine produces
+    them. A final {"run_id", "status", "error"} message is sent once the run
+    has finished, after which the socket is closed.
+    """
+    await websocket.accept()
+    try:
+        run, queue = graph_engine.subscribe(run_id)
+    except KeyError:
+        await websocket.close(code=4404, reason=f"Run with id '{run_id}' not found")
+        return
+
+    try:
+        sent = 0
+        for step in list(run.log):
+            await websocket.send_text(step.model_dump_json())
+            sent += 1
+
+        while run.status == "running":
+            step = await queue.get()
+            if step is None:
+                break
+            # Steps logged while we were replaying arrive twice; skip those
+            if step.step_index < sent:
+                continue
+            await websocket.send_text(step.model_dump_json())
+            sent += 1
+
+        for step in run.log[sent:]:
+            await websocket.send_text(step.model_dump_json())
+
+        await websocket.send_json(
+            {"run_id": run.id, "status": run.status, "error": run.error}
+        )
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        graph_engine.unsubscribe(run_id, queue)
+
+
 @app.get("/")
 def root() -> Dict[str, Any]:
-    \"""
+    """
     Convenience root endpoint.
-    \"""
+    """
     return {
         "message": "Workflow Engine is running",
         "docs": "/docs",
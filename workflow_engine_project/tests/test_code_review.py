@@ -0,0 +1,142 @@
+from copy import deepcopy
+
+import pytest
+
+from app.engine.graph_engine import GraphEngine
+from app.engine.tools import ToolRegistry, register_code_review_tools_and_graph
+
+CLEAN_CODE = "def add(a, b):\n    return a + b\n"
+MESSY_CODE = "def a_b():\n\tprint(1)  # TODO\n"
+COMPLEX_CODE = "def very_long_function_name_x():\n  pass\n"
+
+MESSY_ISSUES = [
+    "Tabs found; prefer spaces for indentation.",
+    "Debug prints found; consider using a logger.",
+    "TODO comments found; make sure they are resolved.",
+]
+MESSY_SUGGESTIONS = [f"Address issue: {issue}" for issue in MESSY_ISSUES] + [
+    "Ensure 'a_b' has a clear docstring explaining inputs and outputs."
+]
+LINEAR_PATH = [
+    "extract_functions",
+    "check_complexity",
+    "detect_basic_issues",
+    "suggest_improvements",
+    "quality_gate",
+]
+
+
+@pytest.fixture
+def engine_and_graph():
+    registry = ToolRegistry()
+    engine = GraphEngine(registry)
+    graph_id = register_code_review_tools_and_graph(engine, registry)
+    return engine, graph_id
+
+
+def reference_run(engine: GraphEngine, graph_id: str, initial_state: dict, max_steps: int):
+    """
+    The original engine loop: copy everything, look up every tool and edge per step.
+    Returns (error, state, current_node_id, [(node_id, input_state, output_state)]).
+    """
+    graph = engine.graphs[graph_id]
+    state = deepcopy(initial_state)
+    current_node_id = graph.start_node_id
+    log = []
+    try:
+        for _ in range(max_steps):
+            if current_node_id is None:
+                break
+            tool_fn = engine.tool_registry.get(graph.nodes[current_node_id])
+            input_state = deepcopy(state)
+            output_state = tool_fn(deepcopy(state))
+            state = state if output_state is None else output_state
+            log.append((current_node_id, input_state, deepcopy(state)))
+            if "_next_node" in state:
+                current_node_id = state.pop("_next_node")
+            else:
+                current_node_id = graph.edges.get(current_node_id)
+        else:
+            raise ValueError(
+                f"Max steps ({max_steps}) reached. Your graph likely has an infinite loop."
+            )
+    except Exception as exc:
+        return str(exc), state, current_node_id, log
+    return None, state, current_node_id, log
+
+
+def test_clean_code_passes_the_quality_gate_first_time(engine_and_graph):
+    engine, graph_id = engine_and_graph
+
+    run_id, final_state, log = engine.run_graph(graph_id, {"code": CLEAN_CODE})
+
+    assert [step.node_id for step in log] == LINEAR_PATH
+    assert final_state == {
+        "code": CLEAN_CODE,
+        "functions": ["add"],
+        "metadata": {"num_functions": 1, "complex_functions": []},
+        "complexity": {"add": 3},
+        "issues": [],
+        "suggestions": ["Ensure 'add' has a clear docstring explaining inputs and outputs."],
+        "quality_score": 1.0,
+    }
+    run = engine.get_run_state(run_id)
+    assert (run.status, run.current_node_id, run.error) == ("completed", None, None)
+    assert run.state == final_state
+
+
+def test_issues_lower_the_score_below_a_low_threshold(engine_and_graph):
+    engine, graph_id = engine_and_graph
+
+    _, final_state, log = engine.run_graph(graph_id, {"code": MESSY_CODE, "threshold": 0.5})
+
+    assert [step.node_id for step in log] == LINEAR_PATH
+    assert final_state["issues"] == MESSY_ISSUES
+    assert final_state["suggestions"] == MESSY_SUGGESTIONS
+    assert final_state["quality_score"] == 0.55
+
+
+def test_failing_quality_gate_loops_until_max_steps(engine_and_graph):
+    engine, graph_id = engine_and_graph
+
+    with pytest.raises(ValueError, match=r"Max steps \(8\) reached"):
+        engine.run_graph(graph_id, {"code": MESSY_CODE, "threshold": 0.8}, max_steps=8)
+
+    run = next(iter(engine.runs.values()))
+    assert [step.node_id for step in run.log] == LINEAR_PATH + [
+        "suggest_improvements",
+        "quality_gate",
+        "suggest_improvements",
+    ]
+    assert run.status == "failed"
+    assert run.current_node_id == "quality_gate"
+    assert run.state["suggestions"] == MESSY_SUGGESTIONS * 3
+
+
+@pytest.mark.parametrize("max_steps", range(1, 11))
+@pytest.mark.parametrize("threshold", [0.1, 0.8])
+@pytest.mark.parametrize("code", [CLEAN_CODE, MESSY_CODE, COMPLEX_CODE])
+def test_runs_match_the_reference_loop(engine_and_graph, code, threshold, max_steps):
+    engine, graph_id = engine_and_graph
+    initial_state = {"code": code, "threshold": threshold}
+    error, state, current_node_id, reference_log = reference_run(
+        engine, graph_id, initial_state, max_steps
+    )
+
+    try:
+        _, final_state, _ = engine.run_graph(graph_id, initial_state, max_steps=max_steps)
+    except ValueError as exc:
+        assert str(exc) == error
+    else:
+        assert error is None
+        assert final_state == state
+
+    run = next(iter(engine.runs.values()))
+    assert run.status == ("completed" if error is None else "failed")
+    assert run.error == error
+    assert run.current_node_id == current_node_id
+    assert run.state == state
+    assert [
+        (step.node_id, step.input_state, step.output_state) for step in run.log
+    ] == reference_log
+    assert initial_state == {"code": code, "threshold": threshold}
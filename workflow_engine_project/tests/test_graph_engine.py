@@ -0,0 +1,248 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.engine.graph_engine import GraphEngine, _copy_tree, _topo_layers, merge_layer_outputs
+from app.engine.models import GraphCreateRequest, NodeDefinition
+from app.main import app
+from app.engine.tools import ToolRegistry, register_code_review_tools_and_graph
+
+
+def noop_tool(state):
+    return state
+
+
+def make_engine() -> GraphEngine:
+    registry = ToolRegistry()
+    registry.register("noop", noop_tool)
+    engine = GraphEngine(registry)
+    register_code_review_tools_and_graph(engine, registry)
+    return engine
+
+
+def create_graph(engine: GraphEngine, edges, tools=None) -> str:
+    tools = tools or {}
+    return engine.create_graph(
+        GraphCreateRequest(
+            name="test",
+            start_node_id=next(iter(edges)),
+            nodes=[
+                NodeDefinition(id=node_id, tool_name=tools.get(node_id, "noop"))
+                for node_id in edges
+            ],
+            edges=edges,
+        )
+    )
+
+
+def test_copy_tree_copies_containers_and_shares_atomics():
+    state = {"code": "x", "n": 1, "meta": {"tags": ["a"], "pair": (1, ["b"])}, "ids": {1, 2}}
+
+    copied = _copy_tree(state)
+
+    assert copied == state
+    assert copied["code"] is state["code"]
+    assert copied["meta"] is not state["meta"]
+    assert copied["meta"]["tags"] is not state["meta"]["tags"]
+    assert copied["meta"]["pair"][1] is not state["meta"]["pair"][1]
+    # Other types fall back to deepcopy
+    assert copied["ids"] is not state["ids"]
+
+
+def test_create_graph_rejects_unknown_tools():
+    with pytest.raises(ValueError, match="Node 'a' uses unknown tool 'missing'"):
+        create_graph(make_engine(), {"a": None}, tools={"a": "missing"})
+
+
+@pytest.mark.parametrize(
+    "start, edges, message",
+    [
+        ("z", {"a": None}, "start_node_id must be one of the node IDs"),
+        ("a", {"a": None, "z": "a"}, "Edge source 'z' is not a valid node id"),
+        ("a", {"a": ["y", "z"]}, "Edge target 'y' is not a valid node id"),
+    ],
+)
+def test_create_graph_validates_node_ids(start, edges, message):
+    req = GraphCreateRequest(
+        name="bad",
+        start_node_id=start,
+        nodes=[NodeDefinition(id="a", tool_name="noop")],
+        edges=edges,
+    )
+
+    with pytest.raises(ValueError, match=message):
+        make_engine().create_graph(req)
+
+
+def test_create_graph_api_returns_400_for_invalid_graphs():
+    with TestClient(app) as client:
+        resp = client.post(
+            "/graph/create",
+            json={
+                "name": "bad",
+                "start_node_id": "a",
+                "nodes": [{"id": "a", "tool_name": "missing"}],
+                "edges": {"a": None},
+            },
+        )
+
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Node 'a' uses unknown tool 'missing'"
+
+
+def test_topo_layers_groups_nodes_by_dependency_depth():
+    successors = {"a": ["b", "c"], "b": ["d"], "c": ["d"], "d": [], "x": ["a"]}
+
+    assert _topo_layers("a", successors) == [["a"], ["b", "c"], ["d"]]
+
+
+def test_topo_layers_returns_none_for_static_cycles():
+    assert _topo_layers("a", {"a": ["b"], "b": ["a"]}) is None
+
+
+def test_create_graph_orders_layers_by_critical_path():
+    engine = make_engine()
+    graph_id = create_graph(
+        engine,
+        {"a": ["short", "long"], "short": "end", "long": "mid", "mid": "end", "end": None},
+    )
+
+    graph = engine.graphs[graph_id]
+    assert graph.is_fork_join
+    assert graph.layers == [["a"], ["long", "short"], ["mid"], ["end"]]
+
+
+def test_merge_keeps_unchanged_keys_and_applies_changes():
+    state = {"a": 1, "b": 2}
+
+    merged = merge_layer_outputs(state, [{"a": 1, "b": 3}, {"a": 5, "b": 2, "c": 1}])
+
+    assert merged == {"a": 5, "b": 3, "c": 1}
+    assert state == {"a": 1, "b": 2}
+
+
+def test_merge_combines_dict_and_list_updates_to_the_same_key():
+    state = {"metadata": {"lang": "py"}, "notes": ["x"]}
+
+    merged = merge_layer_outputs(
+        state,
+        [
+            {"metadata": {"lang": "py", "one": 1}, "notes": ["x", "a"]},
+            {"metadata": {"lang": "py", "two": 2}, "notes": ["x", "b"]},
+        ],
+    )
+
+    assert merged == {"metadata": {"lang": "py", "one": 1, "two": 2}, "notes": ["x", "a", "b"]}
+
+
+@pytest.mark.parametrize(
+    "outputs",
+    [
+        [{"score": 1}, {"score": 2}],
+        [{"metadata": {"k": 1}}, {"metadata": {"k": 2}}],
+        [{"notes": ["a"]}, {"notes": ["b"]}],
+    ],
+)
+def test_merge_rejects_conflicting_updates(outputs):
+    state = {"score": 0, "metadata": {}, "notes": ["x"]}
+
+    with pytest.raises(ValueError, match="conflicting updates"):
+        merge_layer_outputs(state, outputs)
+
+
+def test_fork_join_keeps_metadata_from_all_branches():
+    engine = make_engine()
+    graph_id = create_graph(
+        engine,
+        {
+            "d": ["extract_functions", "quality_gate"],
+            "extract_functions": None,
+            "quality_gate": None,
+        },
+        tools={"extract_functions": "extract_functions", "quality_gate": "quality_gate"},
+    )
+
+    _, final_state, log = asyncio.run(
+        engine.run_graph_async(graph_id, {"code": "def f():\n    pass\n"})
+    )
+
+    assert [step.node_id for step in log] == ["d", "extract_functions", "quality_gate"]
+    assert final_state["metadata"] == {"num_functions": 1, "complex_functions": []}
+    assert final_state["functions"] == ["f"]
+    assert final_state["quality_score"] == 1.0
+
+
+def test_fork_join_rejects_next_node():
+    registry = ToolRegistry()
+    registry.register("noop", noop_tool)
+    registry.register("jump", lambda state: dict(state, _next_node="a"))
+    engine = GraphEngine(registry)
+    graph_id = create_graph(
+        engine, {"a": ["b", "c"], "b": None, "c": None}, tools={"c": "jump"}
+    )
+
+    with pytest.raises(ValueError, match="_next_node"):
+        asyncio.run(engine.run_graph_async(graph_id, {}))
+
+    run = next(iter(engine.runs.values()))
+    assert run.status == "failed"
+
+
+def test_fork_join_checks_max_steps_before_each_layer():
+    engine = make_engine()
+    graph_id = create_graph(engine, {"a": ["b", "c"], "b": "d", "c": "d", "d": None})
+
+    with pytest.raises(ValueError, match="Max steps"):
+        asyncio.run(engine.run_graph_async(graph_id, {}, max_steps=4))
+
+    run = next(iter(engine.runs.values()))
+    assert [step.node_id for step in run.log] == ["a", "b", "c"]
+
+
+@pytest.mark.parametrize(
+    "edges",
+    [
+        {"a": "b", "b": "c", "c": None},
+        {"a": ["b", "c"], "b": None, "c": None},
+    ],
+)
+def test_max_steps_limit_is_the_same_for_both_paths(edges):
+    # Both paths need max_steps to exceed the number of steps a run takes
+    engine = make_engine()
+    graph_id = create_graph(engine, edges)
+
+    with pytest.raises(ValueError, match="Max steps"):
+        asyncio.run(engine.run_graph_async(graph_id, {}, max_steps=3))
+    _, _, log = asyncio.run(engine.run_graph_async(graph_id, {}, max_steps=4))
+    assert len(log) == 3
+
+
+@pytest.mark.parametrize(
+    "edges, message",
+    [
+        ({"a": ["b", "c"], "b": "a", "c": None}, "must not contain a cycle"),
+        ({"a": None, "b": ["a", "c"], "c": None}, "not reachable"),
+    ],
+)
+def test_create_graph_rejects_fan_outs_that_cannot_run(edges, message):
+    with pytest.raises(ValueError, match=message):
+        create_graph(make_engine(), edges)
+
+
+def test_fan_out_into_a_chain_runs_layer_by_layer():
+    engine = make_engine()
+    graph_id = create_graph(engine, {"a": ["b", "c"], "b": "c", "c": None})
+
+    _, _, log = asyncio.run(engine.run_graph_async(graph_id, {}))
+
+    assert [step.node_id for step in log] == ["a", "b", "c"]
+
+
+def test_run_graph_rejects_fork_join_graphs():
+    engine = make_engine()
+    graph_id = create_graph(engine, {"a": ["b", "c"], "b": None, "c": None})
+
+    with pytest.raises(ValueError, match="run_graph_async"):
+        engine.run_graph(graph_id, {})
+    assert engine.runs == {}
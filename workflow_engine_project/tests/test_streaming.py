@@ -0,0 +1,145 @@
+import asyncio
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+from app.engine.graph_engine import GraphEngine, RunRecord
+from app.engine.models import GraphCreateRequest, NodeDefinition
+from app.engine.tools import ToolRegistry
+from app.main import app, tool_registry
+
+
+def slow_counter_tool(state):
+    time.sleep(0.02)
+    state["i"] = state.get("i", 0) + 1
+    state["_next_node"] = "count" if state["i"] < state.get("limit", 10) else None
+    return state
+
+
+def make_counter_graph(engine: GraphEngine) -> str:
+    return engine.create_graph(
+        GraphCreateRequest(
+            name="counter",
+            start_node_id="count",
+            nodes=[NodeDefinition(id="count", tool_name="slow_counter")],
+            edges={"count": None},
+        )
+    )
+
+
+def test_subscriber_receives_live_steps_without_duplicates():
+    registry = ToolRegistry()
+    registry.register("slow_counter", slow_counter_tool)
+    engine = GraphEngine(registry)
+    graph_id = make_counter_graph(engine)
+
+    async def scenario():
+        run_id = engine.start_run(graph_id, {"limit": 10})
+        await asyncio.sleep(0.05)  # let a few steps run before subscribing
+        run, queue = engine.subscribe(run_id)
+        received = [step.step_index for step in list(run.log)]
+        while True:
+            step = await queue.get()
+            if step is None:
+                break
+            if step.step_index >= len(received):
+                received.append(step.step_index)
+        return run, received
+
+    run, received = asyncio.run(scenario())
+    assert run.status == "completed"
+    assert received == list(range(10))
+
+
+def test_publish_drops_subscribers_with_closed_loop():
+    loop = asyncio.new_event_loop()
+    queue = asyncio.Queue()
+    loop.close()
+    record = RunRecord(
+        id="r", graph_id="g", state={}, current_node_id=None, log=[], status="running"
+    )
+    record.subscribers.append((loop, queue))
+
+    record.publish(None)  # must not raise
+
+    assert record.subscribers == []
+
+
+def test_background_run_streams_over_websocket():
+    tool_registry.register("slow_counter", slow_counter_tool)
+    with TestClient(app) as client:
+        graph_id = client.post(
+            "/graph/create",
+            json={
+                "name": "counter",
+                "start_node_id": "count",
+                "nodes": [{"id": "count", "tool_name": "slow_counter"}],
+                "edges": {"count": None},
+            },
+        ).json()["graph_id"]
+
+        resp = client.post(
+            "/graph/run/background",
+            json={"graph_id": graph_id, "initial_state": {"limit": 15}},
+        )
+        assert resp.status_code == 202
+        run_id = resp.json()["run_id"]
+        assert client.get(f"/graph/state/{run_id}").json()["status"] in ("running", "completed")
+
+        messages = []
+        with client.websocket_connect(f"/graph/stream/{run_id}") as ws:
+            while True:
+                message = ws.receive_json()
+                messages.append(message)
+                if "status" in message:
+                    break
+
+        *steps, final = messages
+        assert [step["step_index"] for step in steps] == list(range(15))
+        assert final == {"run_id": run_id, "status": "completed", "error": None}
+        assert client.get(f"/graph/state/{run_id}").json()["state"]["i"] == 15
+
+
+def test_background_run_unknown_graph_is_404():
+    with TestClient(app) as client:
+        resp = client.post("/graph/run/background", json={"graph_id": "nope"})
+        assert resp.status_code == 404
+
+
+def test_background_run_state_is_current_while_running():
+    registry = ToolRegistry()
+    registry.register("slow_counter", slow_counter_tool)
+    engine = GraphEngine(registry)
+    graph_id = make_counter_graph(engine)
+
+    async def scenario():
+        run_id = engine.start_run(graph_id, {"limit": 30})
+        await asyncio.sleep(0.2)
+        polled = engine.get_run_state(run_id)
+        await asyncio.sleep(0.6)
+        return polled
+
+    polled = asyncio.run(scenario())
+    assert polled.status == "running"
+    # The step in flight may already be logged, but the state is never further behind
+    assert len(polled.log) - polled.state["i"] in (0, 1)
+    assert polled.current_node_id == "count"
+
+
+def test_background_run_that_fails_before_starting_is_marked_failed():
+    registry = ToolRegistry()
+    registry.register("slow_counter", slow_counter_tool)
+    engine = GraphEngine(registry)
+    graph_id = make_counter_graph(engine)
+
+    async def scenario():
+        # A lock cannot be copied, so the run fails before taking over its record
+        run_id = engine.start_run(graph_id, {"lock": threading.Lock()})
+        run, queue = engine.subscribe(run_id)
+        return run, await asyncio.wait_for(queue.get(), timeout=5)
+
+    run, item = asyncio.run(scenario())
+    assert item is None
+    assert run.status == "failed"
+    assert "lock" in run.error
@@ -0,0 +1,194 @@
+import pytest
+
+from app.engine.graph_engine import GraphEngine
+from app.engine.models import GraphCreateRequest, NodeDefinition
+from app.engine.tools import (
+    ToolRegistry,
+    check_complexity_tool,
+    register_code_review_tools_and_graph,
+)
+
+
+def build_loop_graph(
+    registry: ToolRegistry, calls: list, inputs=("code",), outputs=("doubled",)
+) -> tuple:
+    """
+    double -> bump -> (back to double until bump has run 3 times)
+    """
+
+    def double_tool(state):
+        calls.append(state.get("code"))
+        state["doubled"] = state.get("code", "") * 2
+        return state
+
+    def bump_tool(state):
+        state["n"] = state.get("n", 0) + 1
+        state["_next_node"] = "double" if state["n"] < 3 else None
+        return state
+
+    registry.register("double", double_tool, pure=True, inputs=inputs, outputs=outputs)
+    registry.register("bump", bump_tool)
+    engine = GraphEngine(registry)
+    graph_id = engine.create_graph(
+        GraphCreateRequest(
+            name="loop",
+            start_node_id="double",
+            nodes=[
+                NodeDefinition(id="double", tool_name="double"),
+                NodeDefinition(id="bump", tool_name="bump"),
+            ],
+            edges={"double": "bump", "bump": None},
+        )
+    )
+    return engine, graph_id
+
+
+def test_pure_tool_reentered_with_same_inputs_is_replayed():
+    calls = []
+    engine, graph_id = build_loop_graph(ToolRegistry(), calls)
+
+    _, final_state, log = engine.run_graph(graph_id, {"code": "ab"})
+
+    assert calls == ["ab"]
+    assert final_state == {"code": "ab", "doubled": "abab", "n": 3}
+    # The replayed step keeps the current value of keys that are not inputs
+    assert log[2].input_state["n"] == 1
+    assert log[2].output_state == {"code": "ab", "doubled": "abab", "n": 1}
+
+
+def test_pure_tool_without_declared_inputs_compares_whole_state():
+    calls = []
+    engine, graph_id = build_loop_graph(ToolRegistry(), calls, inputs=None, outputs=None)
+
+    engine.run_graph(graph_id, {"code": "ab"})
+
+    # "n" changes between visits, so every visit runs the tool
+    assert calls == ["ab", "ab", "ab"]
+
+
+def test_memo_distinguishes_values_with_the_same_str():
+    class Token:
+        def __init__(self, value):
+            self.value = value
+
+        def __str__(self):
+            return "token"
+
+    seen = []
+
+    def read_tool(state):
+        seen.append(state["token"].value)
+        state["_next_node"] = "swap"
+        return state
+
+    def swap_tool(state):
+        state["token"] = Token(2)
+        state["_next_node"] = "read" if len(seen) < 2 else None
+        return state
+
+    registry = ToolRegistry()
+    registry.register("read", read_tool, pure=True, inputs=("token",), outputs=("_next_node",))
+    registry.register("swap", swap_tool)
+    engine = GraphEngine(registry)
+    graph_id = engine.create_graph(
+        GraphCreateRequest(
+            name="tokens",
+            start_node_id="read",
+            nodes=[
+                NodeDefinition(id="read", tool_name="read"),
+                NodeDefinition(id="swap", tool_name="swap"),
+            ],
+            edges={"read": "swap", "swap": None},
+        )
+    )
+
+    engine.run_graph(graph_id, {"token": Token(1)})
+
+    assert seen == [1, 2]
+
+
+def test_memo_accepts_non_string_state_keys():
+    registry = ToolRegistry()
+    engine = GraphEngine(registry)
+    register_code_review_tools_and_graph(engine, registry)
+    tool = registry.get_tool("extract_functions")
+    cache = {}
+
+    first = engine._invoke_tool(tool, {"code": "def add(a, b):\n    pass\n", 1: "x"}, cache)
+    again = engine._invoke_tool(tool, dict(first, functions=None), cache)
+
+    assert first[1] == "x"
+    assert again["functions"] == ["add"]
+
+
+def test_tools_get_their_own_copy_of_top_level_sets():
+    def tag_tool(state):
+        state["tags"].add("seen")
+        return state
+
+    registry = ToolRegistry()
+    registry.register("tag", tag_tool)
+    engine = GraphEngine(registry)
+    graph_id = engine.create_graph(
+        GraphCreateRequest(
+            name="tags",
+            start_node_id="tag",
+            nodes=[NodeDefinition(id="tag", tool_name="tag")],
+            edges={"tag": None},
+        )
+    )
+    tags = set()
+
+    _, final_state, log = engine.run_graph(graph_id, {"tags": tags}, copy_initial_state=False)
+
+    assert tags == set()
+    assert log[0].input_state["tags"] == set()
+    assert final_state["tags"] == {"seen"}
+
+
+def run_complexity_reset_loop(registry: ToolRegistry) -> dict:
+    """
+    check_complexity -> reset, where reset clears "complexity" once and loops back
+    """
+
+    def reset_tool(state):
+        if state.get("looped"):
+            return state
+        state.update({"looped": True, "complexity": {}, "_next_node": "check"})
+        return state
+
+    registry.register("reset", reset_tool)
+    engine = GraphEngine(registry)
+    graph_id = engine.create_graph(
+        GraphCreateRequest(
+            name="reset",
+            start_node_id="check",
+            nodes=[
+                NodeDefinition(id="check", tool_name="check_complexity"),
+                NodeDefinition(id="reset", tool_name="reset"),
+            ],
+            edges={"check": "reset", "reset": None},
+        )
+    )
+    _, final_state, _ = engine.run_graph(
+        graph_id, {"functions": ["a"], "complexity": {"a": 1}}
+    )
+    return final_state
+
+
+def test_replay_restores_outputs_equal_to_their_input():
+    # check_complexity writes {"a": 1}, which equals its input the first time
+    registry = ToolRegistry()
+    register_code_review_tools_and_graph(GraphEngine(registry), registry)
+    memoized = run_complexity_reset_loop(registry)
+
+    plain = ToolRegistry()
+    plain.register("check_complexity", check_complexity_tool)
+
+    assert memoized["complexity"] == {"a": 1}
+    assert memoized == run_complexity_reset_loop(plain)
+
+
+def test_pure_tool_with_inputs_must_declare_outputs():
+    with pytest.raises(ValueError, match="outputs"):
+        ToolRegistry().register("double", lambda state: state, pure=True, inputs=("code",))
@@ -0,0 +1,25 @@
+import pytest
+
+from app.engine.tools import detect_basic_issues_tool
+
+LONG_FILE_ISSUE = "File is quite long; consider splitting into modules."
+
+
+def test_detect_basic_issues_reports_rules_in_order():
+    state = detect_basic_issues_tool({"code": "# TODO\nprint(1)\n\tx = 1\n"})
+
+    assert state["issues"] == [
+        "Tabs found; prefer spaces for indentation.",
+        "Debug prints found; consider using a logger.",
+        "TODO comments found; make sure they are resolved.",
+    ]
+
+
+@pytest.mark.parametrize("sep", ["\n", "\r\n", "\r", "\u2028"])
+def test_detect_basic_issues_flags_files_over_200_lines(sep):
+    # "x = 1" followed by n line breaks is n lines long
+    at_limit = detect_basic_issues_tool({"code": "x = 1" + sep * 200})
+    over_limit = detect_basic_issues_tool({"code": "x = 1" + sep * 201})
+
+    assert LONG_FILE_ISSUE not in at_limit["issues"]
+    assert LONG_FILE_ISSUE in over_limit["issues"]